@@ -1,8 +1,6 @@
 require('dotenv').config();
 const express = require('express');
-const cors = require('cors');
 const helmet = require('helmet');
-const morgan = require('morgan');
 const http = require('http');
 const path = require('path');
 const fs = require('fs');
@@ -10,6 +8,7 @@ const fs = require('fs');
 const routes = require('./src/routes');
 const { initWsServer } = require('./src/websocket/wsServer');
 const logger = require('./src/utils/logger');
+const cors = require('./src/middleware/cors');
 
 // Criar diretório de logs se não existir
 const logDir = path.join(__dirname, 'logs');
@@ -32,12 +31,16 @@ app.use(helmet()); // Adiciona headers de segurança
 app.use(express.json()); // Parser para JSON
 app.use(express.urlencoded({ extended: true })); // Parser para form data
 
-// Logging de requisições HTTP
-app.use(morgan('combined', {
-  stream: {
-    write: (message) => logger.http(message.trim())
-  }
-}));
+// Logging de requisições HTTP (desligado em produção, salvo se HTTP_ACCESS_LOG=true)
+// morgan só é carregado quando o log está ativo
+if (process.env.NODE_ENV !== 'production' || process.env.HTTP_ACCESS_LOG === 'true') {
+  const morgan = require('morgan');
+  app.use(morgan('combined', {
+    stream: {
+      write: (message) => logger.http(message.trim())
+    }
+  }));
+}
 
 // Rotas da API
 app.use('/api', routes);
@@ -48,12 +51,14 @@ const server = http.createServer(app);
 // Inicializar servidor WebSocket
 const wsServer = initWsServer(server);
 
-// Rota raiz
+// Rota raiz (resposta estática, serializada uma única vez; sem link de documentação em produção)
+const rootBody = JSON.stringify({
+  message: 'TradingBot API is running',
+  ...(process.env.NODE_ENV !== 'production' && { documentation: '/api-docs' })
+});
+
 app.get('/', (req, res) => {
-  res.json({
-    message: 'TradingBot API is running',
-    documentation: '/api-docs'
-  });
+  res.type('json').send(rootBody);
 });
 
 // Tratamento de erros
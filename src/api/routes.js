@@ -7,10 +7,11 @@ const riskManager = require('../core/riskManager');
 const orderManager = require('../core/orderManager');
 const strategyManager = require('../core/strategyManager');
 const logger = require('../utils/logger');
+const { nowIso } = require('../utils/time');
 
 // Status da API
 router.get('/status', (req, res) => {
-  res.json({ status: 'OK', timestamp: new Date() });
+  res.json({ status: 'OK', timestamp: nowIso() });
 });
 
 // Dados da conta
@@ -1,16 +1,29 @@
 const logger = require('../utils/logger');
+const { nowIso } = require('../utils/time');
 
 // In-memory bot state 
 let botRunning = false;
+let lastStartTime = null;
+
+// Incremented on every state change; the status body is rebuilt only when it moves
+let stateVersion = 0;
+let statusCache = { version: -1, body: '' };
 
 exports.getBotStatus = async (req, res, next) => {
   try {
-    res.status(200).json({
-      running: botRunning,
-      lastStartTime: botRunning ? new Date().toISOString() : null,
-      activeStrategies: 3,
-      status: botRunning ? 'Online' : 'Offline'
-    });
+    if (statusCache.version !== stateVersion) {
+      statusCache = {
+        version: stateVersion,
+        body: JSON.stringify({
+          running: botRunning,
+          lastStartTime: botRunning ? lastStartTime : null,
+          activeStrategies: 3,
+          status: botRunning ? 'Online' : 'Offline'
+        })
+      };
+    }
+
+    res.status(200).type('json').send(statusCache.body);
   } catch (error) {
     logger.error('Error getting bot status:', error);
     next(error);
@@ -28,7 +41,12 @@ exports.toggleBot = async (req, res, next) => {
       });
     }
 
+    if (active && !botRunning) {
+      lastStartTime = nowIso();
+    }
+
     botRunning = active;
+    stateVersion++;
     
     res.status(200).json({
       success: true,
@@ -86,8 +86,8 @@ exports.createBackup = async (req, res, next) => {
       logger.error('Error creating backup directory:', err);
     }
     
-    // Get settings and strategies
-    const settings = await settingsService.getSettings();
+    // Get settings and strategies (API credentials are never written to backups)
+    const { apiKey, apiSecret, ...settings } = await settingsService.getSettings();
     const strategies = await require('../strategies/strategyManager').getStrategies();
     
     // Create backup data
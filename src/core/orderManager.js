@@ -1,8 +1,13 @@
 // src/core/orderManager.js
 
+const { randomUUID } = require('crypto');
 const binanceService = require('../services/binanceService');
 const logger = require('../utils/logger');
 const riskManager = require('./riskManager');
+const { toEpoch } = require('../utils/time');
+
+// Status em que uma ordem deixa de estar aberta na exchange
+const FINAL_ORDER_STATUSES = new Set(['FILLED', 'CANCELED', 'REJECTED', 'EXPIRED']);
 
 /**
  * Gerenciador de Ordens
@@ -107,28 +112,78 @@ class OrderManager {
    * Verifica status das ordens abertas
    */
   async checkOpenOrdersStatus() {
-    for (const orderId in this.orders.open) {
-      try {
-        const order = this.orders.open[orderId];
-        const response = await binanceService.getOrder(order.symbol, orderId);
-        
-        if (!response.success) {
-          logger.warn(`Erro ao verificar status da ordem ${orderId}:`, response.error);
-          continue;
-        }
-        
-        const updatedOrder = response.data;
-        
-        // Atualizar status interno
-        this.orders.open[orderId] = updatedOrder;
+    const openOrders = Object.entries(this.orders.open);
+    const symbols = [...new Set(openOrders.map(([, order]) => order.symbol))];
+    
+    // Uma chamada por símbolo (peso 6) em vez da consulta sem símbolo, que custa peso 80 na Binance
+    const responses = await Promise.allSettled(symbols.map(async symbol => binanceService.trading.getOpenOrders(symbol)));
+    const stillOpen = new Set();
+    
+    responses.forEach((result, i) => {
+      const response = result.status === 'fulfilled' ? result.value : { success: false, error: result.reason };
+      
+      if (!response.success) {
+        logger.warn(`Erro ao obter ordens abertas de ${symbols[i]}, verificando individualmente:`, response.error);
+        return;
+      }
+      
+      for (const order of response.data) {
+        const orderId = String(order.orderId);
         
-        // Se a ordem foi executada ou cancelada, mover para histórico
-        if (['FILLED', 'CANCELED', 'REJECTED', 'EXPIRED'].includes(updatedOrder.status)) {
-          this.moveOrderToHistory(orderId, updatedOrder);
+        if (this.orders.open[orderId]) {
+          this.orders.open[orderId] = order;
+          stillOpen.add(orderId);
         }
-      } catch (error) {
-        logger.error(`Erro ao verificar status da ordem ${orderId}:`, error);
       }
+    });
+    
+    // Apenas as ordens que saíram da lista (ou cujo símbolo falhou) precisam de consulta individual
+    const orderIds = openOrders
+      .filter(([orderId]) => !stillOpen.has(orderId))
+      .map(([orderId]) => orderId);
+    
+    // Consultas individuais em paralelo; a falha de uma ordem não impede a verificação das demais
+    const results = await Promise.allSettled(orderIds.map(orderId => this.refreshOpenOrder(orderId)));
+    
+    results.forEach((result, i) => {
+      if (result.status === 'rejected') {
+        logger.error(`Erro ao verificar status da ordem ${orderIds[i]}:`, result.reason);
+      }
+    });
+  }
+  
+  /**
+   * Consulta o status de uma ordem aberta e move para o histórico se finalizada
+   * @param {string} orderId - ID da ordem
+   */
+  async refreshOpenOrder(orderId) {
+    const order = this.orders.open[orderId];
+    
+    // A ordem pode ter sido cancelada enquanto as consultas estavam em andamento
+    if (!order) {
+      return;
+    }
+    
+    const response = await binanceService.trading.getOrderStatus(order.symbol, orderId);
+    
+    if (!response.success) {
+      logger.warn(`Erro ao verificar status da ordem ${orderId}:`, response.error);
+      return;
+    }
+    
+    // A ordem pode ter sido removida durante a consulta
+    if (!this.orders.open[orderId]) {
+      return;
+    }
+    
+    const updatedOrder = response.data;
+    
+    // Atualizar status interno
+    this.orders.open[orderId] = updatedOrder;
+    
+    // Se a ordem foi executada ou cancelada, mover para histórico
+    if (FINAL_ORDER_STATUSES.has(updatedOrder.status)) {
+      this.moveOrderToHistory(orderId, updatedOrder);
     }
   }
   
@@ -152,7 +207,7 @@ class OrderManager {
     
     // Limitar tamanho do histórico
     if (this.orders.closed.length > 1000) {
-      this.orders.closed = this.orders.closed.slice(-1000);
+      this.orders.closed.shift();
     }
   }
   
@@ -165,7 +220,7 @@ class OrderManager {
     try {
       if (process.env.SIMULATION_MODE === 'true') {
         logger.info(`[SIMULAÇÃO] Ordem ${orderParams.side} para ${orderParams.symbol} seria executada`);
-        return { success: true, orderId: `sim_${Date.now()}`, data: orderParams };
+        return { success: true, orderId: `sim_${randomUUID()}`, data: orderParams };
       }
 
       // Validar parâmetros
@@ -181,8 +236,8 @@ class OrderManager {
       // Log da ordem
       logger.info(`Enviando ordem: ${orderParams.side} ${orderParams.symbol} @ ${orderParams.price || 'MARKET'}`);
       
-      // Adicionar à lista de ordens pendentes
-      const pendingId = `pending_${Date.now()}`;
+      // Adicionar à lista de ordens pendentes (ID único mesmo para ordens enviadas no mesmo milissegundo)
+      const pendingId = `pending_${randomUUID()}`;
       this.orders.pending[pendingId] = {
         ...orderParams,
         status: 'SENDING',
@@ -266,7 +321,7 @@ class OrderManager {
         };
         
         // Se a ordem foi executada ou cancelada, mover para histórico
-        if (['FILLED', 'CANCELED', 'REJECTED', 'EXPIRED'].includes(orderData.status)) {
+        if (FINAL_ORDER_STATUSES.has(orderData.status)) {
           this.moveOrderToHistory(orderId, orderData);
         }
       }
@@ -505,35 +560,27 @@ class OrderManager {
    * @returns {Array} Histórico de ordens
    */
   getOrderHistory(filters = {}) {
-    let history = [...this.orders.closed];
-    
-    // Aplicar filtros
-    if (filters.symbol) {
-      history = history.filter(order => order.symbol === filters.symbol);
-    }
-    
-    if (filters.side) {
-      history = history.filter(order => order.side === filters.side);
-    }
-    
-    if (filters.status) {
-      history = history.filter(order => order.status === filters.status);
-    }
-    
-    if (filters.startTime) {
-      history = history.filter(order => new Date(order.createdTime) >= new Date(filters.startTime));
-    }
+    // Limites convertidos para epoch uma única vez, sem criar Dates por ordem
+    const startTime = filters.startTime ? toEpoch(filters.startTime) : null;
+    const endTime = filters.endTime ? toEpoch(filters.endTime) : null;
     
-    if (filters.endTime) {
-      history = history.filter(order => new Date(order.createdTime) <= new Date(filters.endTime));
-    }
+    // Aplicar filtros em uma única passagem; o array resultante já é uma cópia,
+    // então o histórico interno não precisa ser duplicado antes
+    const history = this.orders.closed.filter(order => {
+      if (filters.symbol && order.symbol !== filters.symbol) return false;
+      if (filters.side && order.side !== filters.side) return false;
+      if (filters.status && order.status !== filters.status) return false;
+      if (startTime !== null && !(toEpoch(order.createdTime) >= startTime)) return false;
+      if (endTime !== null && !(toEpoch(order.createdTime) <= endTime)) return false;
+      return true;
+    });
     
     // Ordenar por tempo (mais recente primeiro)
-    history.sort((a, b) => new Date(b.createdTime) - new Date(a.createdTime));
+    history.sort((a, b) => toEpoch(b.createdTime) - toEpoch(a.createdTime));
     
     // Limitar quantidade se necessário
     if (filters.limit && filters.limit > 0) {
-      history = history.slice(0, filters.limit);
+      return history.slice(0, filters.limit);
     }
     
     return history;
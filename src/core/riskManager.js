@@ -403,7 +403,8 @@ class RiskManager {
       openPositions: this.state.openPositions,
       tradingEnabled: this.state.tradingEnabled,
       volatilityWarning: this.state.volatilityWarning,
-      assetExposure: this.state.assetExposure
+      // Cópia rasa: o chamador recebe um snapshot, não o mapa de exposição vivo
+      assetExposure: { ...this.state.assetExposure }
     };
   }
   
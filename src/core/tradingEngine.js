@@ -6,13 +6,18 @@ const riskManager = require('./riskManager');
 const orderManager = require('./orderManager');
 const portfolioManager = require('./portfolioManager');
 const logger = require('../utils/logger');
+const { nowIso } = require('../utils/time');
+
+// Resolução do agendador compartilhado das estratégias
+const SCHEDULER_TICK_MS = 1000;
 
 class TradingEngine {
   constructor() {
     this.isRunning = false;
     this.tickerData = {};
     this.websockets = {};
-    this.intervals = {};
+    this.schedule = new Map(); // strategyId -> { strategy, interval, nextRun, running }
+    this.schedulerTimer = null;
     this.strategies = [];
     this.wss = null; // WebSocket server para comunicação com o frontend
   }
@@ -98,11 +103,10 @@ class TradingEngine {
     });
     this.websockets = {};
     
-    // Limpar todos os intervalos
-    Object.values(this.intervals).forEach(interval => {
-      clearInterval(interval);
-    });
-    this.intervals = {};
+    // Parar o agendador das estratégias
+    clearInterval(this.schedulerTimer);
+    this.schedulerTimer = null;
+    this.schedule.clear();
     
     this.isRunning = false;
     
@@ -149,19 +153,51 @@ class TradingEngine {
 
   /**
    * Configura intervalos de verificação para cada estratégia
+   * Todas as estratégias compartilham um único timer; cada uma guarda apenas seu próximo horário de execução
    * @param {Array} strategies - Array de estratégias ativas
    */
   setupStrategyIntervals(strategies) {
+    const now = Date.now();
+    
     strategies.forEach(strategy => {
-      const strategyId = strategy.id;
+      const interval = strategy.checkInterval || 60000; // Default: 1 minuto
       
-      // Intervalo para verificação regular da estratégia
-      this.intervals[strategyId] = setInterval(() => {
-        this.executeStrategy(strategy);
-      }, strategy.checkInterval || 60000); // Default: 1 minuto
+      this.schedule.set(strategy.id, {
+        strategy,
+        interval,
+        nextRun: now + interval,
+        running: false
+      });
       
-      logger.info(`Configurado intervalo para estratégia ${strategy.name} (ID: ${strategyId})`);
+      logger.info(`Configurado intervalo para estratégia ${strategy.name} (ID: ${strategy.id})`);
     });
+    
+    if (!this.schedulerTimer) {
+      this.schedulerTimer = setInterval(() => this.runScheduledStrategies(), SCHEDULER_TICK_MS);
+    }
+  }
+
+  /**
+   * Executa as estratégias cujo intervalo venceu
+   * Uma estratégia ainda em execução não é disparada novamente até terminar
+   */
+  runScheduledStrategies() {
+    const now = Date.now();
+    
+    for (const entry of this.schedule.values()) {
+      if (entry.running || now < entry.nextRun) {
+        continue;
+      }
+      
+      entry.nextRun = now + entry.interval;
+      entry.running = true;
+      
+      this.executeStrategy(entry.strategy)
+        .catch(error => logger.error(`Erro no agendamento da estratégia ${entry.strategy.name}:`, error))
+        .finally(() => {
+          entry.running = false;
+        });
+    }
   }
 
   /**
@@ -404,19 +440,23 @@ class TradingEngine {
   calculateVolatility(prices) {
     if (!prices || prices.length < 2) return 0;
     
-    // Calcular retornos
-    const returns = [];
+    // Média e variância dos retornos em uma única passagem (algoritmo de Welford),
+    // sem alocar o array intermediário de retornos
+    let count = 0;
+    let mean = 0;
+    let m2 = 0;
+    
     for (let i = 1; i < prices.length; i++) {
-      returns.push((prices[i] - prices[i-1]) / prices[i-1]);
+      const value = (prices[i] - prices[i-1]) / prices[i-1];
+      count++;
+      
+      const delta = value - mean;
+      mean += delta / count;
+      m2 += delta * (value - mean);
     }
     
-    // Calcular média
-    const mean = returns.reduce((sum, value) => sum + value, 0) / returns.length;
-    
-    // Calcular desvio padrão
-    const variance = returns.reduce((sum, value) => sum + Math.pow(value - mean, 2), 0) / returns.length;
-    
-    return Math.sqrt(variance);
+    // Desvio padrão populacional
+    return Math.sqrt(m2 / count);
   }
 
   /**
@@ -446,24 +486,37 @@ class TradingEngine {
     return [...new Set(strategies.map(strategy => strategy.pair))];
   }
 
+  /**
+   * Envia uma mensagem a todos os clientes conectados
+   * A mensagem é serializada uma única vez, independentemente do número de clientes
+   * @param {Object} message - Mensagem a ser enviada
+   */
+  broadcast(message) {
+    if (!this.wss || this.wss.clients.size === 0) {
+      return;
+    }
+    
+    const payload = JSON.stringify(message);
+    
+    this.wss.clients.forEach(client => {
+      if (client.readyState === 1) { // OPEN
+        client.send(payload);
+      }
+    });
+  }
+
   /**
    * Envia status do motor para o frontend
    * @param {Object} status - Status do motor
    */
   broadcastStatus(status) {
-    if (this.wss) {
-      this.wss.clients.forEach(client => {
-        if (client.readyState === 1) { // OPEN
-          client.send(JSON.stringify({
-            type: 'ENGINE_STATUS',
-            data: {
-              ...status,
-              timestamp: new Date()
-            }
-          }));
-        }
-      });
-    }
+    this.broadcast({
+      type: 'ENGINE_STATUS',
+      data: {
+        ...status,
+        timestamp: nowIso()
+      }
+    });
   }
 
   /**
@@ -472,22 +525,16 @@ class TradingEngine {
    * @param {Object} data - Dados do ticker
    */
   broadcastTickerUpdate(symbol, data) {
-    if (this.wss) {
-      this.wss.clients.forEach(client => {
-        if (client.readyState === 1) { // OPEN
-          client.send(JSON.stringify({
-            type: 'TICKER_UPDATE',
-            data: {
-              symbol,
-              price: data.c || data.close,
-              change: data.p || data.priceChange,
-              volume: data.v || data.volume,
-              timestamp: new Date()
-            }
-          }));
-        }
-      });
-    }
+    this.broadcast({
+      type: 'TICKER_UPDATE',
+      data: {
+        symbol,
+        price: data.c || data.close,
+        change: data.p || data.priceChange,
+        volume: data.v || data.volume,
+        timestamp: nowIso()
+      }
+    });
   }
 
   /**
@@ -496,20 +543,14 @@ class TradingEngine {
    * @param {Object} data - Dados da atualização
    */
   broadcastStrategyUpdate(strategyId, data) {
-    if (this.wss) {
-      this.wss.clients.forEach(client => {
-        if (client.readyState === 1) { // OPEN
-          client.send(JSON.stringify({
-            type: 'STRATEGY_UPDATE',
-            data: {
-              strategyId,
-              ...data,
-              timestamp: new Date()
-            }
-          }));
-        }
-      });
-    }
+    this.broadcast({
+      type: 'STRATEGY_UPDATE',
+      data: {
+        strategyId,
+        ...data,
+        timestamp: nowIso()
+      }
+    });
   }
 
   /**
@@ -517,16 +558,10 @@ class TradingEngine {
    * @param {Object} trade - Dados do trade
    */
   broadcastTradeUpdate(trade) {
-    if (this.wss) {
-      this.wss.clients.forEach(client => {
-        if (client.readyState === 1) { // OPEN
-          client.send(JSON.stringify({
-            type: 'TRADE_UPDATE',
-            data: trade
-          }));
-        }
-      });
-    }
+    this.broadcast({
+      type: 'TRADE_UPDATE',
+      data: trade
+    });
   }
 }
 
@@ -0,0 +1,57 @@
+/**
+ * CORS middleware with precomputed headers
+ *
+ * The API uses a single static policy (one origin, fixed methods and headers),
+ * so every header value is built once here instead of being re-derived from
+ * the options on each request.
+ *
+ * @param {Object} options - CORS policy
+ * @param {string} options.origin - Allowed origin ('*' for any)
+ * @param {Array<string>} options.methods - Allowed methods
+ * @param {Array<string>} options.allowedHeaders - Allowed request headers
+ * @param {Array<string>} options.exposedHeaders - Headers exposed to the browser
+ * @returns {Function} Express middleware
+ */
+const createCors = ({ origin = '*', methods = [], allowedHeaders = [], exposedHeaders = [] } = {}) => {
+  const varyOnOrigin = origin !== '*';
+
+  const responseHeaders = [['Access-Control-Allow-Origin', origin]];
+  if (exposedHeaders.length > 0) {
+    responseHeaders.push(['Access-Control-Expose-Headers', exposedHeaders.join(',')]);
+  }
+
+  const preflightHeaders = [['Access-Control-Allow-Origin', origin]];
+  if (methods.length > 0) {
+    preflightHeaders.push(['Access-Control-Allow-Methods', methods.join(',')]);
+  }
+  if (allowedHeaders.length > 0) {
+    preflightHeaders.push(['Access-Control-Allow-Headers', allowedHeaders.join(',')]);
+  }
+  if (exposedHeaders.length > 0) {
+    preflightHeaders.push(['Access-Control-Expose-Headers', exposedHeaders.join(',')]);
+  }
+
+  return (req, res, next) => {
+    const preflight = req.method === 'OPTIONS';
+    const headers = preflight ? preflightHeaders : responseHeaders;
+
+    for (const [name, value] of headers) {
+      res.setHeader(name, value);
+    }
+
+    if (varyOnOrigin) {
+      res.vary('Origin');
+    }
+
+    if (preflight) {
+      // Preflight requests are answered here, without reaching the routes
+      res.statusCode = 204;
+      res.setHeader('Content-Length', '0');
+      return res.end();
+    }
+
+    next();
+  };
+};
+
+module.exports = createCors;
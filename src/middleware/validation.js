@@ -1,4 +1,5 @@
 const logger = require('../utils/logger');
+const { VALID_TIMEFRAMES } = require('../utils/timeframes');
 
 /**
  * Validate backtest parameters
@@ -83,8 +84,7 @@ exports.validateStrategyParams = (req, res, next) => {
       });
     }
     
-    const validTimeframes = ['1m', '5m', '15m', '30m', '1h', '4h', '1d'];
-    const invalidTimeframes = timeframes.filter(tf => !validTimeframes.includes(tf));
+    const invalidTimeframes = timeframes.filter(tf => !VALID_TIMEFRAMES.has(tf));
     
     if (invalidTimeframes.length > 0) {
       return res.status(400).json({
@@ -40,187 +40,261 @@ const validateParams = (requiredParams) => {
   };
 };
 
-// Rota para verificar conectividade da API
-router.get('/status', async (req, res) => {
-  try {
-    const result = await binanceService.account.testConnectivity();
-    res.json(result);
-  } catch (error) {
-    logger.error(`Error testing API connectivity: ${error.message}`);
-    res.status(500).json({
+const HAS_LOWERCASE = /[a-z]/;
+
+/**
+ * Normaliza um símbolo ou ativo para maiúsculas, pulando a conversão quando já está no formato esperado
+ * @param {string} value - Símbolo (ex: 'BTCUSDT') ou ativo (ex: 'BTC')
+ * @returns {string} - Valor em maiúsculas
+ */
+const toUpper = (value) => (HAS_LOWERCASE.test(value) ? value.toUpperCase() : value);
+
+// Envio padrão do resultado de uma rota
+const sendJson = (req, res, result) => res.json(result);
+
+/**
+ * Envolve um handler assíncrono com o tratamento de erro padrão das rotas
+ * @param {string} action - Descrição da operação (ex: 'get ticker price'), usada no log e na resposta
+ * @param {function} handler - Função que recebe a requisição e retorna o resultado a ser enviado
+ * @param {function} send - Envia o resultado (req, res, result); por padrão como JSON
+ * @returns {function} - Handler Express
+ */
+const handle = (action, handler, send = sendJson) => {
+  return async (req, res) => {
+    try {
+      await send(req, res, await handler(req));
+    } catch (error) {
+      logger.error(`Failed to ${action}: ${error.message}`);
+      
+      // Uma resposta já iniciada (ex: streaming) não pode mais trocar de status
+      if (res.headersSent) {
+        return res.end();
+      }
+      
+      res.status(500).json({
+        success: false,
+        error: `Failed to ${action}`
+      });
+    }
+  };
+};
+
+// Número máximo de símbolos aceitos em uma consulta de preços em lote
+const MAX_PRICE_SYMBOLS = parseInt(process.env.PRICES_MAX_SYMBOLS) || 100;
+
+/**
+ * Middleware que normaliza o parâmetro `symbols` em uma lista única de símbolos em maiúsculas
+ * Aceita a lista separada por vírgulas e/ou o parâmetro repetido (?symbols=A&symbols=B)
+ */
+const validateSymbolList = (req, res, next) => {
+  const values = [].concat(req.query.symbols || []).filter(value => typeof value === 'string');
+  const symbols = [...new Set(
+    values.flatMap(value => value.split(',')).map(s => toUpper(s.trim())).filter(Boolean)
+  )];
+  
+  if (symbols.length === 0) {
+    return res.status(400).json({
       success: false,
-      error: 'Failed to test API connectivity'
+      error: 'Missing required parameters: symbols'
     });
   }
-});
-
-// Rotas para dados de mercado
-router.get('/ticker/:symbol?', async (req, res) => {
-  try {
-    const symbol = req.params.symbol ? req.params.symbol.toUpperCase() : null;
-    const result = await binanceService.marketData.getTickerPrice(symbol);
-    res.json(result);
-  } catch (error) {
-    logger.error(`Error getting ticker price: ${error.message}`);
-    res.status(500).json({
+  
+  if (symbols.length > MAX_PRICE_SYMBOLS) {
+    return res.status(400).json({
       success: false,
-      error: 'Failed to get ticker price'
+      error: `Too many symbols (maximum ${MAX_PRICE_SYMBOLS})`
     });
   }
+  
+  req.query.symbols = symbols;
+  next();
+};
+
+// Rota para verificar conectividade da API
+router.get('/status', handle('test API connectivity', () => {
+  return binanceService.account.testConnectivity();
+}));
+
+// Rotas para dados de mercado
+router.get('/ticker/:symbol?', handle('get ticker price', (req) => {
+  const symbol = req.params.symbol ? toUpper(req.params.symbol) : null;
+  return binanceService.marketData.getTickerPrice(symbol);
+}));
+
+router.get('/prices', validateSymbolList, handle('get ticker prices', (req) => {
+  return binanceService.marketData.getTickerPrices(req.query.symbols);
+}));
+
+// Corpos já serializados da lista de símbolos (JSON e NDJSON), válidos enquanto o cache do serviço não mudar
+let symbolsBody = { data: null, json: null, ndjson: null };
+
+const NDJSON_TYPE = 'application/x-ndjson';
+
+/**
+ * Verifica se o cliente pediu a resposta em NDJSON
+ * @param {Object} req - Requisição Express
+ * @returns {boolean}
+ */
+const wantsNdjson = (req) => (req.get('Accept') || '').includes(NDJSON_TYPE);
+
+// Tamanho aproximado (em caracteres) de cada bloco escrito no socket ao enviar NDJSON
+const NDJSON_CHUNK_SIZE = 64 * 1024;
+
+/**
+ * Aguarda o socket esvaziar (ou a conexão fechar) antes de continuar escrevendo
+ * @param {Object} res - Resposta Express
+ * @returns {Promise}
+ */
+const waitForDrain = (res) => new Promise(resolve => {
+  const done = () => {
+    res.off('drain', done);
+    res.off('close', done);
+    resolve();
+  };
+  res.on('drain', done);
+  res.on('close', done);
 });
 
-router.get('/klines', validateParams(['symbol', 'interval']), async (req, res) => {
-  try {
-    const { symbol, interval, limit } = req.query;
-    const result = await binanceService.marketData.getKlines(symbol.toUpperCase(), interval, limit);
-    res.json(result);
-  } catch (error) {
-    logger.error(`Error getting klines: ${error.message}`);
-    res.status(500).json({
-      success: false,
-      error: 'Failed to get klines'
-    });
+/**
+ * Envia uma lista como NDJSON (um objeto por linha), agrupando as linhas em blocos
+ * e respeitando o backpressure do socket
+ * @param {Object} res - Resposta Express
+ * @param {Array} items - Itens da lista
+ */
+const streamNdjson = async (res, items) => {
+  res.type(NDJSON_TYPE);
+  
+  let chunk = '';
+  
+  for (const item of items) {
+    chunk += `${JSON.stringify(item)}\n`;
+    
+    if (chunk.length < NDJSON_CHUNK_SIZE) {
+      continue;
+    }
+    
+    if (res.destroyed) {
+      return;
+    }
+    
+    const flushed = res.write(chunk);
+    chunk = '';
+    
+    if (!flushed) {
+      await waitForDrain(res);
+    }
   }
-});
+  
+  if (!res.destroyed) {
+    res.end(chunk);
+  }
+};
 
-router.get('/depth', validateParams(['symbol']), async (req, res) => {
-  try {
-    const { symbol, limit } = req.query;
-    const result = await binanceService.marketData.getOrderBook(symbol.toUpperCase(), limit);
-    res.json(result);
-  } catch (error) {
-    logger.error(`Error getting order book: ${error.message}`);
-    res.status(500).json({
-      success: false,
-      error: 'Failed to get order book'
-    });
+// Linha NDJSON da lista de símbolos
+const serializeSymbol = (symbol) => `{"symbol":${JSON.stringify(symbol)}}`;
+
+/**
+ * Envia uma lista de ordens; clientes que pedem NDJSON recebem uma ordem por linha,
+ * sem serializar o histórico inteiro num único corpo
+ * @param {Object} req - Requisição Express
+ * @param {Object} res - Resposta Express
+ * @param {Object} result - Resultado do serviço
+ */
+const sendOrderList = (req, res, result) => {
+  if (result.success && Array.isArray(result.data) && wantsNdjson(req)) {
+    return streamNdjson(res, result.data);
   }
-});
+  
+  res.json(result);
+};
 
-router.get('/trades', validateParams(['symbol']), async (req, res) => {
-  try {
-    const { symbol, limit } = req.query;
-    const result = await binanceService.marketData.getRecentTrades(symbol.toUpperCase(), limit);
-    res.json(result);
-  } catch (error) {
-    logger.error(`Error getting recent trades: ${error.message}`);
-    res.status(500).json({
-      success: false,
-      error: 'Failed to get recent trades'
-    });
+/**
+ * Envia a lista de símbolos a partir dos corpos já serializados
+ * @param {Object} req - Requisição Express
+ * @param {Object} res - Resposta Express
+ * @param {Object} result - Resultado do serviço
+ */
+const sendSymbols = (req, res, result) => {
+  if (!result.success) {
+    return res.json(result);
   }
-});
+  
+  if (symbolsBody.data !== result.data) {
+    symbolsBody = { data: result.data, json: null, ndjson: null };
+  }
+  
+  // Opt-in: clientes que pedem NDJSON recebem um objeto por linha; o corpo também é montado uma única vez
+  if (wantsNdjson(req)) {
+    if (symbolsBody.ndjson === null) {
+      symbolsBody.ndjson = result.data.map(symbol => `${serializeSymbol(symbol)}\n`).join('');
+    }
+    return res.type(NDJSON_TYPE).send(symbolsBody.ndjson);
+  }
+  
+  if (symbolsBody.json === null) {
+    symbolsBody.json = JSON.stringify(result);
+  }
+  
+  res.type('json').send(symbolsBody.json);
+};
+
+router.get('/symbols', handle('get symbols', () => {
+  return binanceService.marketData.getSymbols();
+}, sendSymbols));
+
+router.get('/klines', validateParams(['symbol', 'interval']), handle('get klines', (req) => {
+  const { symbol, interval, limit } = req.query;
+  return binanceService.marketData.getKlines(toUpper(symbol), interval, limit);
+}));
+
+router.get('/depth', validateParams(['symbol']), handle('get order book', (req) => {
+  const { symbol, limit } = req.query;
+  return binanceService.marketData.getOrderBook(toUpper(symbol), limit);
+}));
+
+router.get('/trades', validateParams(['symbol']), handle('get recent trades', (req) => {
+  const { symbol, limit } = req.query;
+  return binanceService.marketData.getRecentTrades(toUpper(symbol), limit);
+}));
 
 // Rotas para conta
-router.get('/account', async (req, res) => {
-  try {
-    const result = await binanceService.account.getAccountInfo();
-    res.json(result);
-  } catch (error) {
-    logger.error(`Error getting account info: ${error.message}`);
-    res.status(500).json({
-      success: false,
-      error: 'Failed to get account info'
-    });
-  }
-});
+router.get('/account', handle('get account info', () => {
+  return binanceService.account.getAccountInfo();
+}));
 
-router.get('/account/asset/:asset', async (req, res) => {
-  try {
-    const asset = req.params.asset.toUpperCase();
-    const result = await binanceService.account.getAssetBalance(asset);
-    res.json(result);
-  } catch (error) {
-    logger.error(`Error getting asset balance: ${error.message}`);
-    res.status(500).json({
-      success: false,
-      error: 'Failed to get asset balance'
-    });
-  }
-});
+router.get('/account/asset/:asset', handle('get asset balance', (req) => {
+  const asset = toUpper(req.params.asset);
+  return binanceService.account.getAssetBalance(asset);
+}));
 
-router.get('/my-trades', validateParams(['symbol']), async (req, res) => {
-  try {
-    const { symbol, limit } = req.query;
-    const result = await binanceService.account.getMyTrades(symbol.toUpperCase(), limit);
-    res.json(result);
-  } catch (error) {
-    logger.error(`Error getting my trades: ${error.message}`);
-    res.status(500).json({
-      success: false,
-      error: 'Failed to get my trades'
-    });
-  }
-});
+router.get('/my-trades', validateParams(['symbol']), handle('get my trades', (req) => {
+  const { symbol, limit } = req.query;
+  return binanceService.account.getMyTrades(toUpper(symbol), limit);
+}));
 
 // Rotas para trading
-router.post('/order', checkSimulationMode, validateParams(['symbol', 'side', 'type', 'quantity']), async (req, res) => {
-  try {
-    const result = await binanceService.trading.createOrder(req.body);
-    res.json(result);
-  } catch (error) {
-    logger.error(`Error creating order: ${error.message}`);
-    res.status(500).json({
-      success: false,
-      error: 'Failed to create order'
-    });
-  }
-});
+router.post('/order', checkSimulationMode, validateParams(['symbol', 'side', 'type', 'quantity']), handle('create order', (req) => {
+  return binanceService.trading.createOrder(req.body);
+}));
 
-router.get('/order', validateParams(['symbol', 'orderId']), async (req, res) => {
-  try {
-    const { symbol, orderId } = req.query;
-    const result = await binanceService.trading.getOrderStatus(symbol.toUpperCase(), orderId);
-    res.json(result);
-  } catch (error) {
-    logger.error(`Error getting order status: ${error.message}`);
-    res.status(500).json({
-      success: false,
-      error: 'Failed to get order status'
-    });
-  }
-});
+router.get('/order', validateParams(['symbol', 'orderId']), handle('get order status', (req) => {
+  const { symbol, orderId } = req.query;
+  return binanceService.trading.getOrderStatus(toUpper(symbol), orderId);
+}));
 
-router.delete('/order', checkSimulationMode, validateParams(['symbol', 'orderId']), async (req, res) => {
-  try {
-    const { symbol, orderId } = req.query;
-    const result = await binanceService.trading.cancelOrder(symbol.toUpperCase(), orderId);
-    res.json(result);
-  } catch (error) {
-    logger.error(`Error cancelling order: ${error.message}`);
-    res.status(500).json({
-      success: false,
-      error: 'Failed to cancel order'
-    });
-  }
-});
+router.delete('/order', checkSimulationMode, validateParams(['symbol', 'orderId']), handle('cancel order', (req) => {
+  const { symbol, orderId } = req.query;
+  return binanceService.trading.cancelOrder(toUpper(symbol), orderId);
+}));
 
-router.get('/open-orders', async (req, res) => {
-  try {
-    const { symbol } = req.query;
-    const result = await binanceService.trading.getOpenOrders(symbol ? symbol.toUpperCase() : null);
-    res.json(result);
-  } catch (error) {
-    logger.error(`Error getting open orders: ${error.message}`);
-    res.status(500).json({
-      success: false,
-      error: 'Failed to get open orders'
-    });
-  }
-});
+router.get('/open-orders', handle('get open orders', (req) => {
+  const { symbol } = req.query;
+  return binanceService.trading.getOpenOrders(symbol ? toUpper(symbol) : null);
+}, sendOrderList));
 
-router.get('/order-history', validateParams(['symbol']), async (req, res) => {
-  try {
-    const { symbol, limit } = req.query;
-    const result = await binanceService.trading.getOrderHistory(symbol.toUpperCase(), limit);
-    res.json(result);
-  } catch (error) {
-    logger.error(`Error getting order history: ${error.message}`);
-    res.status(500).json({
-      success: false,
-      error: 'Failed to get order history'
-    });
-  }
-});
+router.get('/order-history', validateParams(['symbol']), handle('get order history', (req) => {
+  const { symbol, limit } = req.query;
+  return binanceService.trading.getOrderHistory(toUpper(symbol), limit);
+}, sendOrderList));
 
 module.exports = router;
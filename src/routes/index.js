@@ -4,13 +4,14 @@ const strategyController = require('../controllers/strategyController');
 const dashboardController = require('../controllers/dashboardController');
 const botController = require('../controllers/botController');
 const binanceRoutes = require('./binanceRoutes');
+const { nowIso } = require('../utils/time');
 
 // Rota de status da API
 router.get('/status', (req, res) => {
   res.json({
     status: 'online',
     version: '1.0.0',
-    timestamp: new Date().toISOString()
+    timestamp: nowIso()
   });
 });
 
@@ -1,13 +1,20 @@
 const axios = require('axios');
 const crypto = require('crypto');
-const { WebSocket } = require('ws');
 const logger = require('../utils/logger');
+const { httpsAgent } = require('../utils/httpAgent');
 
 // Carrega as credenciais das variáveis de ambiente
 const API_KEY = process.env.BINANCE_API_KEY;
 const API_SECRET = process.env.BINANCE_API_SECRET;
 const USE_TESTNET = process.env.USE_BINANCE_TESTNET === 'true';
 
+// Prévia da API Key exibida nas respostas (calculada uma única vez)
+const API_KEY_PREVIEW = API_KEY ? `${API_KEY.slice(0, 8)}...` : null;
+
+// Chave de assinatura e cabeçalho de autenticação preparados uma única vez, fora do caminho das requisições
+const SIGNING_KEY = API_SECRET ? crypto.createSecretKey(Buffer.from(API_SECRET, 'utf8')) : null;
+const AUTH_HEADERS = { 'X-MBX-APIKEY': API_KEY };
+
 // Define as URLs base com base na configuração
 const BASE_URL = USE_TESTNET 
   ? 'https://testnet.binance.vision/api' 
@@ -17,6 +24,12 @@ const WS_BASE_URL = USE_TESTNET
   ? 'wss://testnet.binance.vision/ws'
   : 'wss://stream.binance.com:9443/ws';
 
+// Cliente HTTP compartilhado por todas as requisições à API REST
+const httpClient = axios.create({
+  baseURL: BASE_URL,
+  httpsAgent
+});
+
 // Cache para limites de taxa
 const rateLimits = {
   lastRequestTime: 0,
@@ -25,6 +38,58 @@ const rateLimits = {
   maxRequests: parseInt(process.env.RATE_LIMIT) || 10
 };
 
+// Cache da lista de símbolos negociáveis (exchangeInfo muda raramente)
+const symbolsCache = {
+  data: null,
+  expiresAt: 0,
+  pending: null,
+  ttl: parseInt(process.env.SYMBOLS_CACHE_TTL) || 60 * 60 * 1000
+};
+
+// Micro-cache de preços: absorve rajadas de polling do frontend e
+// compartilha a mesma requisição entre chamadas simultâneas
+const tickerCache = {
+  entries: new Map(),
+  pending: new Map(),
+  ttl: parseInt(process.env.TICKER_CACHE_TTL) || 500,
+  maxEntries: parseInt(process.env.TICKER_CACHE_MAX_ENTRIES) || 2048
+};
+
+// Cache curto das informações da conta: leituras em rajada (/account, /account/asset)
+// compartilham uma única chamada assinada; criar ou cancelar ordens invalida o cache
+const accountCache = {
+  result: null,
+  expiresAt: 0,
+  pending: null,
+  generation: 0,
+  ttl: parseInt(process.env.ACCOUNT_CACHE_TTL) || 2000
+};
+
+/**
+ * Descarta as informações de conta em cache (saldos podem ter mudado)
+ */
+const invalidateAccountCache = () => {
+  accountCache.result = null;
+  accountCache.expiresAt = 0;
+  accountCache.pending = null;
+  accountCache.generation++;
+};
+
+/**
+ * Grava um preço no micro-cache, descartando a entrada mais antiga quando o limite é atingido
+ * (o Map preserva a ordem de inserção, então a primeira chave é a gravada há mais tempo)
+ * @param {string} key - Símbolo ou '*' para todos os preços
+ * @param {Object} entry - Entrada { result, expiresAt }
+ */
+const setTickerEntry = (key, entry) => {
+  tickerCache.entries.delete(key);
+  tickerCache.entries.set(key, entry);
+  
+  if (tickerCache.entries.size > tickerCache.maxEntries) {
+    tickerCache.entries.delete(tickerCache.entries.keys().next().value);
+  }
+};
+
 /**
  * Gera uma assinatura HMAC-SHA256 para autenticação
  * @param {string} queryString - String de consulta para assinar
@@ -32,7 +97,7 @@ const rateLimits = {
  */
 const createSignature = (queryString) => {
   return crypto
-    .createHmac('sha256', API_SECRET)
+    .createHmac('sha256', SIGNING_KEY)
     .update(queryString)
     .digest('hex');
 };
@@ -42,26 +107,27 @@ const createSignature = (queryString) => {
  * @returns {Promise} - Promessa que resolve quando é seguro fazer uma nova solicitação
  */
 const applyRateLimit = async () => {
-  const now = Date.now();
-  const elapsedTime = now - rateLimits.lastRequestTime;
+  // Chamadores que esperaram voltam a disputar a vaga; só passam quando há espaço na janela atual
+  for (;;) {
+    const now = Date.now();
+    const elapsedTime = now - rateLimits.lastRequestTime;
 
-  // Redefine o contador se estiver em uma nova janela de tempo
-  if (elapsedTime > rateLimits.windowSize) {
-    rateLimits.requestsInWindow = 0;
-    rateLimits.lastRequestTime = now;
-    return Promise.resolve();
-  }
+    // Redefine o contador se estiver em uma nova janela de tempo
+    if (elapsedTime >= rateLimits.windowSize) {
+      rateLimits.requestsInWindow = 0;
+      rateLimits.lastRequestTime = now;
+    }
+
+    if (rateLimits.requestsInWindow < rateLimits.maxRequests) {
+      rateLimits.requestsInWindow++;
+      return;
+    }
 
-  // Verifica se atingimos o limite de solicitações
-  if (rateLimits.requestsInWindow >= rateLimits.maxRequests) {
     // Espera até o final da janela de tempo atual
-    const timeToWait = rateLimits.windowSize - elapsedTime;
+    const timeToWait = rateLimits.windowSize - (now - rateLimits.lastRequestTime);
     logger.debug(`Rate limit reached, waiting ${timeToWait}ms`);
-    return new Promise(resolve => setTimeout(resolve, timeToWait));
+    await new Promise(resolve => setTimeout(resolve, timeToWait));
   }
-
-  rateLimits.requestsInWindow++;
-  return Promise.resolve();
 };
 
 /**
@@ -77,7 +143,7 @@ const makeRequest = async (endpoint, method = 'GET', params = {}, requiresAuth =
     await applyRateLimit();
     
     let queryString = '';
-    let url = `${BASE_URL}${endpoint}`;
+    let url = endpoint;
 
     // Adiciona timestamp e prepara a string de consulta para assinatura
     if (requiresAuth) {
@@ -99,18 +165,13 @@ const makeRequest = async (endpoint, method = 'GET', params = {}, requiresAuth =
       url = `${url}?${queryString}`;
     }
 
-    // Configura o cabeçalho com a API Key se necessário
-    const headers = {};
-    if (requiresAuth) {
-      headers['X-MBX-APIKEY'] = API_KEY;
-    }
-
-    logger.debug(`Making ${method} request to ${url}`);
+    logger.debug(`Making ${method} request to ${BASE_URL}${url}`);
 
-    const response = await axios({
+    // Envia o cabeçalho com a API Key apenas se necessário
+    const response = await httpClient.request({
       method,
       url,
-      headers,
+      headers: requiresAuth ? AUTH_HEADERS : undefined,
       data: method !== 'GET' ? params : undefined
     });
 
@@ -147,6 +208,8 @@ const makeRequest = async (endpoint, method = 'GET', params = {}, requiresAuth =
  * @returns {WebSocket} - Objeto WebSocket
  */
 const createWebSocketConnection = (stream, onMessage, onError, onClose) => {
+  // Carregado sob demanda: quem usa apenas a API REST não precisa do cliente WebSocket
+  const { WebSocket } = require('ws');
   const url = `${WS_BASE_URL}/${stream}`;
   const ws = new WebSocket(url);
   
@@ -185,9 +248,102 @@ const marketData = {
    * @returns {Promise} - Preço atual
    */
   getTickerPrice: async (symbol) => {
+    const key = symbol || '*';
+    const cached = tickerCache.entries.get(key);
+    
+    if (cached && Date.now() < cached.expiresAt) {
+      return cached.result;
+    }
+    
+    // Reutiliza uma requisição já em andamento para o mesmo símbolo
+    if (tickerCache.pending.has(key)) {
+      return await tickerCache.pending.get(key);
+    }
+    
     const endpoint = '/v3/ticker/price';
     const params = symbol ? { symbol } : {};
-    return await makeRequest(endpoint, 'GET', params);
+    const request = makeRequest(endpoint, 'GET', params)
+      .then(result => {
+        if (result.success) {
+          setTickerEntry(key, { result, expiresAt: Date.now() + tickerCache.ttl });
+        }
+        return result;
+      })
+      .finally(() => tickerCache.pending.delete(key));
+    
+    tickerCache.pending.set(key, request);
+    return await request;
+  },
+  
+  /**
+   * Obtém o preço atual de vários símbolos em uma única requisição
+   * @param {Array<string>} symbols - Símbolos de trading (ex: ['BTCUSDT', 'ETHUSDT'])
+   * @returns {Promise} - Lista de preços
+   */
+  getTickerPrices: async (symbols) => {
+    const endpoint = '/v3/ticker/price';
+    const params = { symbols: JSON.stringify(symbols) };
+    const result = await makeRequest(endpoint, 'GET', params);
+    
+    // Alimenta o cache individual para que /ticker/:symbol aproveite o lote
+    if (result.success) {
+      const expiresAt = Date.now() + tickerCache.ttl;
+      for (const ticker of result.data) {
+        setTickerEntry(ticker.symbol, { result: { success: true, data: ticker }, expiresAt });
+      }
+    }
+    
+    return result;
+  },
+  
+  /**
+   * Obtém as regras de negociação e informações dos símbolos
+   * @returns {Promise} - Informações da exchange
+   */
+  getExchangeInfo: async () => {
+    const endpoint = '/v3/exchangeInfo';
+    return await makeRequest(endpoint, 'GET');
+  },
+  
+  /**
+   * Obtém os símbolos disponíveis para negociação (com cache)
+   * @returns {Promise} - Lista de símbolos com status TRADING
+   */
+  getSymbols: async () => {
+    if (symbolsCache.data && Date.now() < symbolsCache.expiresAt) {
+      return { success: true, data: symbolsCache.data };
+    }
+    
+    // Reutiliza um download já em andamento: o exchangeInfo é grande e tem peso alto na Binance
+    if (symbolsCache.pending) {
+      return await symbolsCache.pending;
+    }
+    
+    const request = marketData.getExchangeInfo()
+      .then(exchangeInfo => {
+        if (!exchangeInfo.success) {
+          return exchangeInfo;
+        }
+        
+        // Passagem única sobre a lista; o resultado é congelado pois é compartilhado pelo cache
+        const symbols = [];
+        for (const info of exchangeInfo.data.symbols) {
+          if (info.status === 'TRADING') {
+            symbols.push(info.symbol);
+          }
+        }
+        
+        symbolsCache.data = Object.freeze(symbols);
+        symbolsCache.expiresAt = Date.now() + symbolsCache.ttl;
+        
+        return { success: true, data: symbols };
+      })
+      .finally(() => {
+        symbolsCache.pending = null;
+      });
+    
+    symbolsCache.pending = request;
+    return await request;
   },
   
   /**
@@ -237,7 +393,11 @@ const trading = {
    */
   createOrder: async (orderParams) => {
     const endpoint = '/v3/order';
-    return await makeRequest(endpoint, 'POST', orderParams, true);
+    try {
+      return await makeRequest(endpoint, 'POST', orderParams, true);
+    } finally {
+      invalidateAccountCache();
+    }
   },
   
   /**
@@ -249,7 +409,11 @@ const trading = {
   cancelOrder: async (symbol, orderId) => {
     const endpoint = '/v3/order';
     const params = { symbol, orderId };
-    return await makeRequest(endpoint, 'DELETE', params, true);
+    try {
+      return await makeRequest(endpoint, 'DELETE', params, true);
+    } finally {
+      invalidateAccountCache();
+    }
   },
   
   /**
@@ -295,8 +459,34 @@ const account = {
    * @returns {Promise} - Informações da conta
    */
   getAccountInfo: async () => {
+    if (accountCache.result && Date.now() < accountCache.expiresAt) {
+      return accountCache.result;
+    }
+    
+    // Reutiliza uma requisição já em andamento
+    if (accountCache.pending) {
+      return await accountCache.pending;
+    }
+    
     const endpoint = '/v3/account';
-    return await makeRequest(endpoint, 'GET', {}, true);
+    const generation = accountCache.generation;
+    const request = makeRequest(endpoint, 'GET', {}, true)
+      .then(result => {
+        // Não grava o resultado se uma ordem invalidou o cache durante a requisição
+        if (result.success && generation === accountCache.generation) {
+          accountCache.result = result;
+          accountCache.expiresAt = Date.now() + accountCache.ttl;
+        }
+        return result;
+      })
+      .finally(() => {
+        if (accountCache.pending === request) {
+          accountCache.pending = null;
+        }
+      });
+    
+    accountCache.pending = request;
+    return await request;
   },
   
   /**
@@ -337,18 +527,18 @@ const account = {
    */
   testConnectivity: async () => {
     try {
-      // Primeiro teste da API pública
-      const pingResponse = await makeRequest('/v3/ping', 'GET');
+      // Testa a API pública e a privada em paralelo; a chamada assinada não passa pelo cache da conta
+      const [pingResponse, accountResponse] = await Promise.all([
+        makeRequest('/v3/ping', 'GET'),
+        makeRequest('/v3/account', 'GET', {}, true)
+      ]);
       
       if (!pingResponse.success) {
         return pingResponse;
       }
       
-      // Teste da API privada
-      const accountResponse = await account.getAccountInfo();
-      
       return accountResponse.success 
-        ? { success: true, message: 'API connection successful', data: { apiKey: API_KEY.slice(0, 8) + '...' } }
+        ? { success: true, message: 'API connection successful', data: { apiKey: API_KEY_PREVIEW } }
         : accountResponse;
     } catch (error) {
       logger.error(`API Connectivity test failed: ${error.message}`);
@@ -1,6 +1,6 @@
 const axios = require('axios');
 const logger = require('../utils/logger');
-const settingsService = require('./settingsService');
+const { httpsAgent } = require('../utils/httpAgent');
 
 /**
  * Fetch historical data from exchange or data provider
@@ -12,7 +12,6 @@ const settingsService = require('./settingsService');
  */
 exports.fetchHistoricalData = async (symbol, startDate, endDate, timeframes = ['1m', '5m', '15m', '1h', '4h', '1d']) => {
   try {
-    const settings = await settingsService.getSettings();
     const startTimestamp = new Date(startDate).getTime();
     const endTimestamp = new Date(endDate).getTime();
     
@@ -31,8 +30,8 @@ exports.fetchHistoricalData = async (symbol, startDate, endDate, timeframes = ['
       // Binance API has a limit of 1000 candles per request
       const maxCandles = 1000;
       
-      // Initialize array to store all candles
-      let allCandles = [];
+      // Candles are formatted as each page arrives, straight into a single result array
+      const formattedCandles = [];
       
       // If we need more than maxCandles, we need to make multiple requests
       if (candlesCount > maxCandles) {
@@ -42,26 +41,17 @@ exports.fetchHistoricalData = async (symbol, startDate, endDate, timeframes = ['
           const currentEnd = Math.min(currentStart + (maxCandles * interval), endTimestamp);
           
           const candles = await fetchCandlesFromBinance(symbol, timeframe, currentStart, currentEnd);
-          allCandles = [...allCandles, ...candles];
+          appendFormattedCandles(formattedCandles, candles);
           
           // Update current start for next iteration
           currentStart = currentEnd;
         }
       } else {
         // We can fetch all candles in one request
-        allCandles = await fetchCandlesFromBinance(symbol, timeframe, startTimestamp, endTimestamp);
+        const candles = await fetchCandlesFromBinance(symbol, timeframe, startTimestamp, endTimestamp);
+        appendFormattedCandles(formattedCandles, candles);
       }
       
-      // Format the candles
-      const formattedCandles = allCandles.map(candle => ({
-        time: candle[0],
-        open: parseFloat(candle[1]),
-        high: parseFloat(candle[2]),
-        low: parseFloat(candle[3]),
-        close: parseFloat(candle[4]),
-        volume: parseFloat(candle[5])
-      }));
-      
       results[timeframe] = formattedCandles;
     }
     
@@ -89,7 +79,8 @@ async function fetchCandlesFromBinance(symbol, interval, startTime, endTime) {
         startTime: startTime,
         endTime: endTime,
         limit: 1000
-      }
+      },
+      httpsAgent
     });
     
     return response.data;
@@ -99,6 +90,24 @@ async function fetchCandlesFromBinance(symbol, interval, startTime, endTime) {
   }
 }
 
+/**
+ * Convert raw Binance klines to candle objects and append them to the target array
+ * @param {Array} target - Array receiving the formatted candles
+ * @param {Array} candles - Raw klines as returned by the API
+ */
+function appendFormattedCandles(target, candles) {
+  for (const candle of candles) {
+    target.push({
+      time: candle[0],
+      open: parseFloat(candle[1]),
+      high: parseFloat(candle[2]),
+      low: parseFloat(candle[3]),
+      close: parseFloat(candle[4]),
+      volume: parseFloat(candle[5])
+    });
+  }
+}
+
 /**
  * Convert timeframe string to milliseconds
  * @param {string} timeframe - Timeframe (e.g. '1h', '4h', '1d')
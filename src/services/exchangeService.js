@@ -2,6 +2,27 @@ const axios = require('axios');
 const crypto = require('crypto');
 const settingsService = require('./settingsService');
 const logger = require('../utils/logger');
+const { httpsAgent } = require('../utils/httpAgent');
+
+// Last secret imported as an HMAC key; rebuilt only when the configured secret changes
+let signingKey = { secret: null, key: null };
+
+/**
+ * Sign a query string with the given API secret
+ * @param {string} apiSecret - API secret
+ * @param {string} queryString - Query string to sign
+ * @returns {string} Hex signature
+ */
+const sign = (apiSecret, queryString) => {
+  if (signingKey.secret !== apiSecret) {
+    signingKey = { secret: apiSecret, key: crypto.createSecretKey(Buffer.from(apiSecret, 'utf8')) };
+  }
+  
+  return crypto
+    .createHmac('sha256', signingKey.key)
+    .update(queryString)
+    .digest('hex');
+};
 
 /**
  * Test connection to exchange API
@@ -10,10 +31,14 @@ const logger = require('../utils/logger');
  */
 exports.testConnection = async (credentials = null) => {
   try {
-    // Get credentials from settings if not provided
-    const settings = await settingsService.getSettings();
-    const apiKey = credentials?.apiKey || settings.apiKey;
-    const apiSecret = credentials?.apiSecret || settings.apiSecret;
+    // Get credentials from settings only if not provided
+    let apiKey = credentials?.apiKey;
+    let apiSecret = credentials?.apiSecret;
+    if (!apiKey || !apiSecret) {
+      const settings = await settingsService.getSettings();
+      apiKey = apiKey || settings.apiKey;
+      apiSecret = apiSecret || settings.apiSecret;
+    }
     
     if (!apiKey || !apiSecret) {
       return {
@@ -27,10 +52,7 @@ exports.testConnection = async (credentials = null) => {
     const queryString = `timestamp=${timestamp}`;
     
     // Sign request
-    const signature = crypto
-      .createHmac('sha256', apiSecret)
-      .update(queryString)
-      .digest('hex');
+    const signature = sign(apiSecret, queryString);
     
     // Make API request
     const response = await axios.get('https://api.binance.com/api/v3/account', {
@@ -40,7 +62,8 @@ exports.testConnection = async (credentials = null) => {
       params: {
         timestamp,
         signature
-      }
+      },
+      httpsAgent
     });
     
     logger.info('API connection test successful');
@@ -88,10 +111,7 @@ exports.getAccountInfo = async () => {
     const timestamp = Date.now();
     const queryString = `timestamp=${timestamp}`;
     
-    const signature = crypto
-      .createHmac('sha256', apiSecret)
-      .update(queryString)
-      .digest('hex');
+    const signature = sign(apiSecret, queryString);
     
     const response = await axios.get('https://api.binance.com/api/v3/account', {
       headers: {
@@ -100,7 +120,8 @@ exports.getAccountInfo = async () => {
       params: {
         timestamp,
         signature
-      }
+      },
+      httpsAgent
     });
     
     return {
@@ -23,12 +23,21 @@ const defaultSettings = {
   }
 };
 
+// In-memory copy of the settings file, loaded on first access
+let cachedSettings = null;
+
 /**
  * Get settings
  * @returns {Object} Settings object
  */
 exports.getSettings = async () => {
   try {
+    // Serve from memory to avoid filesystem round-trips on every call;
+    // callers get a shallow copy so they can mask fields safely
+    if (cachedSettings) {
+      return { ...cachedSettings };
+    }
+    
     // Create settings directory if it doesn't exist
     const settingsDir = path.dirname(settingsFilePath);
     await fs.mkdir(settingsDir, { recursive: true });
@@ -36,12 +45,16 @@ exports.getSettings = async () => {
     // Try to read settings file
     try {
       const data = await fs.readFile(settingsFilePath, 'utf8');
-      return JSON.parse(data);
+      
+      // An update may have filled the cache while the file was being read; keep the newer copy
+      cachedSettings = cachedSettings || JSON.parse(data);
+      return { ...cachedSettings };
     } catch (err) {
       if (err.code === 'ENOENT') {
         // File doesn't exist, create with default settings
         await fs.writeFile(settingsFilePath, JSON.stringify(defaultSettings, null, 2));
-        return defaultSettings;
+        cachedSettings = cachedSettings || { ...defaultSettings };
+        return { ...cachedSettings };
       }
       throw err;
     }
@@ -76,6 +89,7 @@ exports.updateSettings = async (newSettings) => {
     };
     
     await fs.writeFile(settingsFilePath, JSON.stringify(updatedSettings, null, 2));
+    cachedSettings = updatedSettings;
     
     return { success: true };
   } catch (error) {
@@ -91,6 +105,7 @@ exports.updateSettings = async (newSettings) => {
 exports.resetSettings = async () => {
   try {
     await fs.writeFile(settingsFilePath, JSON.stringify(defaultSettings, null, 2));
+    cachedSettings = { ...defaultSettings };
     return { success: true };
   } catch (error) {
     logger.error('Error resetting settings:', error);
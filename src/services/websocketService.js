@@ -1,3 +1,4 @@
+const { randomUUID } = require('crypto');
 const WebSocket = require('ws');
 const logger = require('../utils/logger');
 const config = require('../config/appConfig');
@@ -21,7 +22,7 @@ class WebSocketService {
    * @returns {string} - Connection ID
    */
   createConnection(streamName, onMessage) {
-    const connectionId = `${streamName}_${Date.now()}`;
+    const connectionId = `${streamName}_${randomUUID()}`;
     const fullUrl = `${this.baseWsUrl}/${streamName}`;
     
     logger.info(`Creating WebSocket connection to ${fullUrl}`);
@@ -1,5 +1,6 @@
 const EventEmitter = require('events');
 const logger = require('../../utils/logger');
+const { VALID_TIMEFRAMES } = require('../../utils/timeframes');
 
 class BaseStrategy extends EventEmitter {
   constructor(config) {
@@ -70,8 +71,7 @@ class BaseStrategy extends EventEmitter {
   }
 
   static validateTimeframes(timeframes) {
-    const validTimeframes = ['1m', '5m', '15m', '30m', '1h', '4h', '1d'];
-    return timeframes.every(t => validTimeframes.includes(t));
+    return timeframes.every(t => VALID_TIMEFRAMES.has(t));
   }
 }
 
@@ -109,26 +109,32 @@ class BaseStrategy {
       this.candles[timeframe] = [];
     }
     
-    // Verificar se o candle já existe (baseado no timestamp)
-    const index = this.candles[timeframe].findIndex(c => c.time === formattedCandle.time);
+    const candles = this.candles[timeframe];
+    const lastIndex = candles.length - 1;
+    
+    // Verificar se o candle já existe (baseado no timestamp); as atualizações do
+    // stream quase sempre são do último candle, então ele é verificado primeiro
+    const index = lastIndex >= 0 && candles[lastIndex].time === formattedCandle.time
+      ? lastIndex
+      : candles.findIndex(c => c.time === formattedCandle.time);
     
     if (index >= 0) {
       // Atualizar candle existente
-      this.candles[timeframe][index] = formattedCandle;
+      candles[index] = formattedCandle;
     } else {
       // Adicionar novo candle
-      this.candles[timeframe].push(formattedCandle);
+      candles.push(formattedCandle);
       
       // Manter apenas os últimos 1000 candles
-      if (this.candles[timeframe].length > 1000) {
-        this.candles[timeframe].shift();
+      if (candles.length > 1000) {
+        candles.shift();
       }
     }
     
     // Atualizar dados de preço para o par
     this.priceData = {
       last: formattedCandle.close,
-      updated: new Date()
+      updated: Date.now()
     };
     
     // Atualizar indicadores se o candle foi fechado
@@ -151,11 +157,21 @@ class BaseStrategy {
           continue; // Não há dados suficientes
         }
         
-        // Extrair arrays de OHLC
-        const closes = this.candles[timeframe].map(c => c.close);
-        const highs = this.candles[timeframe].map(c => c.high);
-        const lows = this.candles[timeframe].map(c => c.low);
-        const volumes = this.candles[timeframe].map(c => c.volume);
+        // Extrair arrays de OHLC (colunas preenchidas em uma única passagem pelos candles)
+        const candles = this.candles[timeframe];
+        const count = candles.length;
+        const closes = new Array(count);
+        const highs = new Array(count);
+        const lows = new Array(count);
+        const volumes = new Array(count);
+        
+        for (let i = 0; i < count; i++) {
+          const candle = candles[i];
+          closes[i] = candle.close;
+          highs[i] = candle.high;
+          lows[i] = candle.low;
+          volumes[i] = candle.volume;
+        }
         
         // Inicializar objeto de indicadores para este timeframe
         if (!this.indicatorValues[timeframe]) {
@@ -2,6 +2,7 @@
 
 const GridTradingStrategy = require('./gridTrading');
 const logger = require('../utils/logger');
+const { nowIso } = require('../utils/time');
 
 // In-memory strategy storage (would use a database in production)
 const strategies = [];
@@ -34,7 +35,7 @@ strategies.push({
     rebalanceGrid: false,
     rebalanceInterval: 24
   },
-  createdAt: new Date().toISOString()
+  createdAt: nowIso()
 });
 
 /**
@@ -69,7 +70,7 @@ exports.saveStrategyConfiguration = async (config) => {
       strategies[existingIndex] = {
         ...strategies[existingIndex],
         ...config,
-        updatedAt: new Date().toISOString()
+        updatedAt: nowIso()
       };
       return { success: true, strategy: strategies[existingIndex] };
     } else {
@@ -77,7 +78,7 @@ exports.saveStrategyConfiguration = async (config) => {
       const newStrategy = {
         ...config,
         id: String(nextId++),
-        createdAt: new Date().toISOString()
+        createdAt: nowIso()
       };
       strategies.push(newStrategy);
       return { success: true, strategy: newStrategy };
@@ -0,0 +1,18 @@
+// src/utils/httpAgent.js
+
+const https = require('https');
+
+/**
+ * Agente HTTPS com keep-alive compartilhado por todos os clientes da Binance
+ * As credenciais vão nos headers de cada requisição, então clientes com chaves
+ * diferentes podem reaproveitar as mesmas conexões TCP/TLS
+ */
+const httpsAgent = new https.Agent({
+  keepAlive: true,
+  maxSockets: 64,
+  maxFreeSockets: 32
+});
+
+module.exports = {
+  httpsAgent
+};
@@ -0,0 +1,48 @@
+// src/utils/time.js
+
+/**
+ * Utilitários de data/hora para os caminhos de resposta da API
+ */
+
+let lastTimestamp = 0;
+let lastIsoString = '';
+
+/**
+ * Retorna o instante atual em formato ISO 8601 (UTC)
+ * Reaproveita a string formatada enquanto o relógio não avança de milissegundo,
+ * evitando alocar um Date e formatar a data a cada chamada em rajadas
+ * @returns {string} - Data/hora atual em ISO 8601
+ */
+function nowIso() {
+  const now = Date.now();
+  
+  if (now !== lastTimestamp) {
+    lastTimestamp = now;
+    lastIsoString = new Date(now).toISOString();
+  }
+  
+  return lastIsoString;
+}
+
+/**
+ * Converte um instante (Date, epoch em ms ou string de data) para epoch em ms
+ * Dates e números são lidos diretamente, sem alocar um novo Date
+ * @param {Date|number|string} value - Instante a converter
+ * @returns {number} - Epoch em ms (NaN se ausente ou inválido)
+ */
+function toEpoch(value) {
+  if (value instanceof Date) {
+    return value.getTime();
+  }
+  
+  if (typeof value === 'number') {
+    return value;
+  }
+  
+  return value ? new Date(value).getTime() : NaN;
+}
+
+module.exports = {
+  nowIso,
+  toEpoch
+};
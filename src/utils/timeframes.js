@@ -0,0 +1,10 @@
+// src/utils/timeframes.js
+
+/**
+ * Timeframes aceitos pelas estratégias, compartilhados pela validação das rotas e pelas estratégias
+ */
+const VALID_TIMEFRAMES = new Set(['1m', '5m', '15m', '30m', '1h', '4h', '1d']);
+
+module.exports = {
+  VALID_TIMEFRAMES
+};
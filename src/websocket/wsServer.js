@@ -7,6 +7,141 @@ const binanceService = require('../services/binanceService');
 // Armazena todas as conexões ativas
 const activeConnections = new Map();
 
+// Streams da Binance compartilhados entre clientes: chave `${type}|${streamName}` -> { streamName, type, binanceWs, subscribers, reconnectAttempts, closed }
+const sharedStreams = new Map();
+
+const maxReconnectAttempts = parseInt(process.env.MAX_RECONNECT_ATTEMPTS, 10) || 5;
+const reconnectDelay = parseInt(process.env.RECONNECT_DELAY, 10) || 5000;
+
+/**
+ * Envia uma mensagem já serializada a todos os clientes inscritos em um stream
+ * @param {Object} shared - Stream compartilhado
+ * @param {string} message - Mensagem JSON
+ */
+const broadcastToSubscribers = (shared, message) => {
+  for (const client of shared.subscribers) {
+    if (client.readyState === WebSocket.OPEN) {
+      client.send(message);
+    }
+  }
+};
+
+/**
+ * Abre (ou reabre) a conexão com a Binance de um stream compartilhado
+ * @param {Object} shared - Stream compartilhado
+ */
+const connectSharedStream = (shared) => {
+  shared.binanceWs = binanceService.createWebSocketConnection(
+    shared.streamName,
+    (data) => {
+      shared.reconnectAttempts = 0;
+      
+      // Serializa uma única vez por mensagem, independentemente do número de clientes
+      broadcastToSubscribers(shared, JSON.stringify({
+        type: shared.type,
+        data: data
+      }));
+    },
+    (error) => {
+      // O evento 'close' sempre segue o erro e trata a reconexão
+      logger.error(`Binance WebSocket error: ${error.message}`);
+    },
+    () => {
+      logger.info(`Binance WebSocket closed for ${shared.streamName}`);
+      reconnectSharedStream(shared);
+    }
+  );
+};
+
+/**
+ * Agenda a reconexão de um stream compartilhado que ainda possui clientes
+ * @param {Object} shared - Stream compartilhado
+ */
+const reconnectSharedStream = (shared) => {
+  if (shared.closed) {
+    return;
+  }
+  
+  if (shared.reconnectAttempts >= maxReconnectAttempts) {
+    logger.error(`Maximum reconnection attempts reached for ${shared.streamName}`);
+    broadcastToSubscribers(shared, JSON.stringify({
+      type: 'error',
+      message: 'Failed to reconnect to Binance WebSocket'
+    }));
+
+    // Descarta o stream para que novos inscritos abram uma conexão nova em vez de aguardar um socket morto
+    shared.closed = true;
+    const key = `${shared.type}|${shared.streamName}`;
+    if (sharedStreams.get(key) === shared) {
+      sharedStreams.delete(key);
+    }
+    return;
+  }
+  
+  shared.reconnectAttempts++;
+  logger.info(`Attempting to reconnect to Binance WebSocket (${shared.reconnectAttempts}/${maxReconnectAttempts})`);
+  
+  setTimeout(() => {
+    if (!shared.closed) {
+      connectSharedStream(shared);
+    }
+  }, reconnectDelay);
+};
+
+/**
+ * Inscreve um cliente em um stream da Binance, abrindo a conexão apenas para o primeiro inscrito
+ * @param {WebSocket} ws - Conexão WebSocket do cliente
+ * @param {string} type - Tipo de mensagem enviado ao cliente
+ * @param {string} streamName - Nome do stream na Binance
+ * @returns {string} - Chave do stream compartilhado
+ */
+const subscribeStream = (ws, type, streamName) => {
+  const key = `${type}|${streamName}`;
+  let shared = sharedStreams.get(key);
+  
+  if (!shared) {
+    shared = {
+      streamName,
+      type,
+      binanceWs: null,
+      subscribers: new Set(),
+      reconnectAttempts: 0,
+      closed: false
+    };
+    sharedStreams.set(key, shared);
+    connectSharedStream(shared);
+  }
+  
+  shared.subscribers.add(ws);
+  return key;
+};
+
+/**
+ * Remove um cliente de um stream, fechando a conexão com a Binance quando não restam inscritos
+ * @param {WebSocket} ws - Conexão WebSocket do cliente
+ * @param {string} key - Chave do stream compartilhado
+ */
+const unsubscribeStream = (ws, key) => {
+  const shared = sharedStreams.get(key);
+  
+  if (!shared) {
+    return;
+  }
+  
+  shared.subscribers.delete(ws);
+  
+  if (shared.subscribers.size === 0) {
+    shared.closed = true;
+    sharedStreams.delete(key);
+    
+    if (shared.binanceWs && shared.binanceWs.readyState === WebSocket.OPEN) {
+      shared.binanceWs.close();
+    } else if (shared.binanceWs && shared.binanceWs.readyState === WebSocket.CONNECTING) {
+      shared.binanceWs.terminate();
+    }
+  }
+};
+
 /**
  * Gerencia as conexões WebSocket de acordo com o tipo
  * @param {WebSocket} ws - Conexão WebSocket do cliente
@@ -14,68 +149,13 @@ const activeConnections = new Map();
  * @param {object} query - Parâmetros da consulta
  */
 const handleConnection = (ws, path, query) => {
-  let binanceWs = null;
+  let streamKey = null;
   let pingInterval = null;
-  let reconnectAttempts = 0;
-  const maxReconnectAttempts = parseInt(process.env.MAX_RECONNECT_ATTEMPTS, 10) || 5;
-  const reconnectDelay = parseInt(process.env.RECONNECT_DELAY, 10) || 5000;
+  const type = path.substring(4); // Remove '/ws/' do início
   
   // Identificador único para a conexão
   const connectionId = `${path}-${Date.now()}-${Math.random().toString(36).substring(2, 15)}`;
   
-  // Função para reconectar ao WebSocket da Binance
-  const reconnectBinanceWs = (streamName) => {
-    if (reconnectAttempts >= maxReconnectAttempts) {
-      logger.error(`Maximum reconnection attempts reached for ${streamName}`);
-      if (ws.readyState === WebSocket.OPEN) {
-        ws.send(JSON.stringify({
-          type: 'error',
-          message: 'Failed to reconnect to Binance WebSocket'
-        }));
-      }
-      return;
-    }
-    
-    reconnectAttempts++;
-    logger.info(`Attempting to reconnect to Binance WebSocket (${reconnectAttempts}/${maxReconnectAttempts})`);
-    
-    setTimeout(() => {
-      setupBinanceConnection(streamName);
-    }, reconnectDelay);
-  };
-  
-  // Configuração da conexão Binance com base no tipo de stream
-  const setupBinanceConnection = (streamName) => {
-    binanceWs = binanceService.createWebSocketConnection(
-      streamName,
-      (data) => {
-        if (ws.readyState === WebSocket.OPEN) {
-          ws.send(JSON.stringify({
-            type: path.substring(4), // Remove '/ws/' do início
-            data: data
-          }));
-        }
-      },
-      (error) => {
-        logger.error(`Binance WebSocket error: ${error.message}`);
-        if (binanceWs) {
-          try {
-            binanceWs.close();
-          } catch (e) {
-            logger.error(`Error closing Binance WebSocket: ${e.message}`);
-          }
-        }
-        reconnectBinanceWs(streamName);
-      },
-      () => {
-        logger.info(`Binance WebSocket closed for ${streamName}`);
-        reconnectBinanceWs(streamName);
-      }
-    );
-    
-    return binanceWs;
-  };
-  
   // Função para limpar conexões e intervalos
   const cleanup = () => {
     if (pingInterval) {
@@ -83,9 +163,9 @@ const handleConnection = (ws, path, query) => {
       pingInterval = null;
     }
     
-    if (binanceWs && binanceWs.readyState === WebSocket.OPEN) {
-      binanceWs.close();
-      binanceWs = null;
+    if (streamKey) {
+      unsubscribeStream(ws, streamKey);
+      streamKey = null;
     }
     
     activeConnections.delete(connectionId);
@@ -96,7 +176,7 @@ const handleConnection = (ws, path, query) => {
   try {
     if (path.startsWith('/ws/ticker')) {
       const symbol = (query.symbol || 'btcusdt').toLowerCase();
-      binanceWs = setupBinanceConnection(`${symbol}@ticker`);
+      streamKey = subscribeStream(ws, type, `${symbol}@ticker`);
       logger.info(`WebSocket ticker connection established for ${symbol}`);
       
       ws.send(JSON.stringify({
@@ -108,7 +188,7 @@ const handleConnection = (ws, path, query) => {
     else if (path.startsWith('/ws/kline')) {
       const symbol = (query.symbol || 'btcusdt').toLowerCase();
       const interval = query.interval || '1m';
-      binanceWs = setupBinanceConnection(`${symbol}@kline_${interval}`);
+      streamKey = subscribeStream(ws, type, `${symbol}@kline_${interval}`);
       logger.info(`WebSocket kline connection established for ${symbol} (${interval})`);
       
       ws.send(JSON.stringify({
@@ -120,7 +200,7 @@ const handleConnection = (ws, path, query) => {
     else if (path.startsWith('/ws/depth')) {
       const symbol = (query.symbol || 'btcusdt').toLowerCase();
       const levels = query.levels || '20'; // 5, 10, 20 são os valores válidos
-      binanceWs = setupBinanceConnection(`${symbol}@depth${levels}`);
+      streamKey = subscribeStream(ws, type, `${symbol}@depth${levels}`);
       logger.info(`WebSocket depth connection established for ${symbol} (levels: ${levels})`);
       
       ws.send(JSON.stringify({
@@ -131,7 +211,7 @@ const handleConnection = (ws, path, query) => {
     }
     else if (path.startsWith('/ws/trades')) {
       const symbol = (query.symbol || 'btcusdt').toLowerCase();
-      binanceWs = setupBinanceConnection(`${symbol}@trade`);
+      streamKey = subscribeStream(ws, type, `${symbol}@trade`);
       logger.info(`WebSocket trade connection established for ${symbol}`);
       
       ws.send(JSON.stringify({
@@ -143,7 +223,7 @@ const handleConnection = (ws, path, query) => {
     else if (path.startsWith('/ws/multi')) {
       // Permite assinar múltiplos streams com formato: symbol1@ticker+symbol2@kline_1m
       const streams = query.streams ? query.streams.split('+') : ['btcusdt@ticker'];
-      binanceWs = setupBinanceConnection(streams.join('/'));
+      streamKey = subscribeStream(ws, type, streams.join('/'));
       logger.info(`WebSocket multi-stream connection established: ${streams.join(', ')}`);
       
       ws.send(JSON.stringify({
@@ -163,7 +243,7 @@ const handleConnection = (ws, path, query) => {
     }
     
     // Adiciona à lista de conexões ativas
-    activeConnections.set(connectionId, { ws, binanceWs, path, query });
+    activeConnections.set(connectionId, { ws, stream: streamKey, path, query });
     
     // Configurar ping/pong para manter a conexão viva
     pingInterval = setInterval(() => {
@@ -189,6 +269,9 @@ const handleConnection = (ws, path, query) => {
     
   } catch (error) {
     logger.error(`Error handling WebSocket connection: ${error.message}`);
+    if (streamKey) {
+      unsubscribeStream(ws, streamKey);
+    }
     if (ws.readyState === WebSocket.OPEN) {
       ws.send(JSON.stringify({
         type: 'error',